@@ -5,18 +5,21 @@ Provides a desktop interface to manage MCP servers, view tools, and monitor logs
 
 import sys
 import os
+import functools
 import json
+import http.client
 import subprocess
 import threading
 import time
 import platform
+import signal
 import urllib.request
 import urllib.error
 from datetime import datetime
 
 import customtkinter as ctk
 
-from hub_client import MCPHubClient
+from hub_client import MCPHubClient, run_async
 from servers_tab import ServersTab
 from logs_tab import LogsTab
 
@@ -26,9 +29,13 @@ ctk.set_default_color_theme("blue")
 
 # ── Constants ────────────────────────────────────────────────────────────────
 DEFAULT_PORT = 3000
+# Health poll interval. Hub events only add refreshes on top of this, since
+# not every status change (e.g. a stdio server exiting) is broadcast
+HEALTH_POLL_MS = 3000
 CONFIG_FILENAME = "mcp-servers.json"
 
 
+@functools.cache
 def find_project_root():
     """Walk up from this file to find the project root (where package.json lives)."""
     d = os.path.dirname(os.path.abspath(__file__))
@@ -60,6 +67,11 @@ class MCPHubApp(ctk.CTk):
         self.port = DEFAULT_PORT
         self.config_path = os.path.join(PROJECT_ROOT, CONFIG_FILENAME)
         self.client = MCPHubClient(port=self.port)
+        self._hub_lines = []  # hub output waiting to be drained on the Tk thread
+        self._hub_lines_lock = threading.Lock()
+        self._events_stop = threading.Event()
+        self._health_pending = False  # a health fetch is queued or in flight
+        self._health_again = False  # another fetch was requested meanwhile
 
         self._build_ui()
         self._poll_health()
@@ -100,18 +112,24 @@ class MCPHubApp(ctk.CTk):
         self.port_entry.pack(side="right", padx=(0, 6))
 
         # Tabs
-        self.tabview = ctk.CTkTabview(self)
+        self.tabview = ctk.CTkTabview(self, command=self._on_tab_change)
         self.tabview.pack(fill="both", expand=True, padx=8, pady=(0, 8))
 
         self.tabview.add("Servers")
         self.tabview.add("Logs")
 
-        self.servers_tab = ServersTab(self.tabview.tab("Servers"), self.client)
+        self.servers_tab = ServersTab(
+            self.tabview.tab("Servers"), self.client, on_toggle=self._refresh_health
+        )
         self.servers_tab.pack(fill="both", expand=True)
 
         self.logs_tab = LogsTab(self.tabview.tab("Logs"), self.client, PROJECT_ROOT)
         self.logs_tab.pack(fill="both", expand=True)
 
+    def _on_tab_change(self):
+        if self.tabview.get() == "Logs":
+            self.logs_tab.on_show()
+
     # ── Hub lifecycle ────────────────────────────────────────────────────
 
     def _read_port(self):
@@ -155,25 +173,31 @@ class MCPHubApp(ctk.CTk):
                     cmd,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.STDOUT,
+                    encoding="utf-8",
+                    errors="replace",
+                    bufsize=1,
                     cwd=PROJECT_ROOT,
-                    creationflags=subprocess.CREATE_NO_WINDOW
-                    if platform.system() == "Windows"
-                    else 0,
+                    **self._hub_popen_kwargs(),
                 )
                 self.hub_running = True
+                self._events_stop = threading.Event()
+                threading.Thread(
+                    target=self._watch_events, args=(self._events_stop,), daemon=True
+                ).start()
                 self.after(0, lambda: self.start_btn.configure(state="normal", text="Stop Hub"))
                 self.after(0, lambda: self.status_label.configure(text="Running", text_color="#2ecc71"))
                 self.after(0, lambda: self.logs_tab.append_log("INFO", "Hub process started"))
 
                 # Stream stdout to log tab
-                for line in iter(self.hub_process.stdout.readline, b""):
-                    text = line.decode("utf-8", errors="replace").rstrip()
+                for line in self.hub_process.stdout:
+                    text = line.rstrip()
                     if text:
-                        self.after(0, lambda t=text: self.logs_tab.append_log("HUB", t))
+                        self._queue_hub_line(text)
 
                 # Process exited
                 self.hub_process.wait()
                 self.hub_running = False
+                self._events_stop.set()
                 self.after(0, lambda: self.start_btn.configure(state="normal", text="Start Hub"))
                 self.after(0, lambda: self.status_label.configure(text="Stopped", text_color="gray"))
                 self.after(0, lambda: self.logs_tab.append_log("INFO", "Hub process exited"))
@@ -185,14 +209,59 @@ class MCPHubApp(ctk.CTk):
 
         threading.Thread(target=run, daemon=True).start()
 
+    @staticmethod
+    def _hub_popen_kwargs():
+        """Start the hub in its own process group so it can be signalled as a whole."""
+        if platform.system() == "Windows":
+            flags = subprocess.CREATE_NEW_PROCESS_GROUP
+            if sys.stdout is None:
+                # pythonw has no console to share, so don't pop one up
+                flags |= subprocess.CREATE_NO_WINDOW
+            return {"creationflags": flags}
+        return {"start_new_session": True}
+
+    def _terminate_hub(self, timeout):
+        """Ask the hub to shut down gracefully, killing its process group on timeout."""
+        proc = self.hub_process
+        windows = platform.system() == "Windows"
+        try:
+            if windows:
+                proc.send_signal(signal.CTRL_BREAK_EVENT)
+            else:
+                os.killpg(os.getpgid(proc.pid), signal.SIGTERM)
+            proc.wait(timeout=timeout)
+        except Exception:
+            try:
+                if windows:
+                    proc.kill()
+                else:
+                    os.killpg(os.getpgid(proc.pid), signal.SIGKILL)
+            except Exception:
+                pass
+
+    def _queue_hub_line(self, text):
+        """Queue a hub output line from the reader thread.
+
+        Only the first line of a batch schedules a drain, so a burst of
+        output costs one Tk callback instead of one per line.
+        """
+        with self._hub_lines_lock:
+            self._hub_lines.append(text)
+            first = len(self._hub_lines) == 1
+        if first:
+            self.after(0, self._drain_hub_lines)
+
+    def _drain_hub_lines(self):
+        with self._hub_lines_lock:
+            lines, self._hub_lines = self._hub_lines, []
+        for text in lines:
+            self.logs_tab.append_log("HUB", text)
+
     def _stop_hub(self):
         self.logs_tab.append_log("INFO", "Stopping MCP Hub...")
+        self._events_stop.set()
         if self.hub_process:
-            try:
-                self.hub_process.terminate()
-                self.hub_process.wait(timeout=5)
-            except Exception:
-                self.hub_process.kill()
+            self._terminate_hub(timeout=5)
             self.hub_process = None
         self.hub_running = False
         self.start_btn.configure(text="Start Hub")
@@ -221,28 +290,53 @@ class MCPHubApp(ctk.CTk):
     def _poll_health(self):
         """Poll the hub /api/health endpoint to refresh the servers tab."""
         if self.hub_running:
-            def fetch():
-                try:
-                    data = self.client.get_health()
-                    if data:
-                        self.after(0, lambda: self.servers_tab.refresh(data.get("servers", [])))
-                except Exception:
-                    pass
-            threading.Thread(target=fetch, daemon=True).start()
-        self.after(3000, self._poll_health)
+            self._refresh_health()
+        self.after(HEALTH_POLL_MS, self._poll_health)
+
+    def _refresh_health(self):
+        """Fetch health in the background, with at most one fetch queued at a time.
+
+        A request made while one is outstanding is folded into a single
+        follow-up fetch, so a hung hub cannot pile up polls ahead of toggles.
+        """
+        if self._health_pending:
+            self._health_again = True
+            return
+        self._health_pending = True
+        run_async(self, self.client.get_health, callback=self._on_health)
+
+    def _on_health(self, result):
+        self._health_pending = False
+        if self._health_again:
+            # Asked again while in flight (e.g. after a toggle): this result may be stale
+            self._health_again = False
+            self._refresh_health()
+        data, sig = result or (None, None)
+        if data:
+            self.servers_tab.refresh(data.get("servers", []), sig=sig)
+
+    def _watch_events(self, stop):
+        """Follow the hub's SSE stream on a worker thread, reconnecting until stopped."""
+        while not stop.is_set():
+            try:
+                if not self.client.stream_events(self._on_hub_event, stop):
+                    # No event endpoint: keep relying on the regular poll
+                    return
+            except (OSError, http.client.HTTPException):
+                pass
+            stop.wait(1)
+
+    def _on_hub_event(self, event, data):
+        """Called on the events thread. Events carry no server list, so fetch one."""
+        if event in ("heartbeat", "log"):
+            return
+        self.after(0, self._refresh_health)
 
     # ── Cleanup ──────────────────────────────────────────────────────────
 
     def destroy(self):
         if self.hub_process:
-            try:
-                self.hub_process.terminate()
-                self.hub_process.wait(timeout=3)
-            except Exception:
-                try:
-                    self.hub_process.kill()
-                except Exception:
-                    pass
+            self._terminate_hub(timeout=3)
         super().destroy()
 
 
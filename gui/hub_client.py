@@ -2,17 +2,63 @@
 HTTP client for the MCP Hub REST API.
 """
 
+import http.client
 import json
-import urllib.request
-import urllib.error
+import queue
+import threading
+
+
+# Calls queued by run_async, served by a single long-lived daemon thread
+_tasks = queue.SimpleQueue()
+_worker = None
+_worker_lock = threading.Lock()
+
+
+def _work():
+    while True:
+        widget, fn, args, kwargs, callback = _tasks.get()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception:
+            result = None
+        if callback:
+            try:
+                widget.after(0, callback, result)
+            except Exception:
+                # The widget was destroyed meanwhile; that must not kill the worker
+                pass
+
+
+def run_async(widget, fn, *args, callback=None, **kwargs):
+    """Run ``fn`` on the background worker and hand its result to ``callback`` on the Tk thread.
+
+    Calls run one at a time in FIFO order; if ``fn`` raises, ``callback`` gets None.
+    """
+    global _worker
+    with _worker_lock:
+        if _worker is None:
+            _worker = threading.Thread(target=_work, name="hub-client", daemon=True)
+            _worker.start()
+    _tasks.put((widget, fn, args, kwargs, callback))
 
 
 class MCPHubClient:
-    """Thin wrapper around the MCP Hub HTTP API."""
+    """Thin wrapper around the MCP Hub HTTP API.
+
+    All methods block on network I/O and must never be called from the Tk
+    main thread; dispatch them with ``run_async`` instead.
+    """
+
+    _EMPTY_BODY = b"{}"
+    _decoder = json.JSONDecoder()
+    # Server fields that change on every poll without user-visible effect
+    _VOLATILE_SERVER_KEYS = frozenset({"uptime"})
 
     def __init__(self, host="127.0.0.1", port=3000):
         self.host = host
         self.port = port
+        self._conn = None
+        self._lock = threading.Lock()
 
     @property
     def base_url(self):
@@ -20,32 +66,119 @@ class MCPHubClient:
 
     # ── Generic helpers ──────────────────────────────────────────────────
 
-    def _get(self, path, timeout=5):
-        url = f"{self.base_url}{path}"
-        req = urllib.request.Request(url)
+    def _connection(self, timeout):
+        """Return the kept-alive connection, reopening it if the port changed."""
+        conn = self._conn
+        if conn is not None and (conn.host, conn.port) != (self.host, self.port):
+            self._close()
+            conn = None
+        if conn is None:
+            conn = http.client.HTTPConnection(self.host, self.port, timeout=timeout)
+            self._conn = conn
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn
+
+    def _close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _request(self, method, path, body=None, timeout=5):
+        """Send a request over the shared connection and return the raw body.
+
+        Returns None on any failure or non-2xx status. A reused connection
+        that the hub has already closed is retried once on a fresh socket.
+        """
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        with self._lock:
+            for attempt in range(2):
+                reused = self._conn is not None and self._conn.sock is not None
+                try:
+                    conn = self._connection(timeout)
+                    conn.request(method, path, body=body, headers=headers)
+                    resp = conn.getresponse()
+                    data = resp.read()
+                except (http.client.RemoteDisconnected, ConnectionError):
+                    self._close()
+                    if reused and attempt == 0:
+                        continue
+                    return None
+                except Exception:
+                    self._close()
+                    return None
+                return data if 200 <= resp.status < 300 else None
+
+    def _decode(self, data):
+        if data is None:
+            return None
         try:
-            with urllib.request.urlopen(req, timeout=timeout) as resp:
-                return json.loads(resp.read().decode())
+            return self._decoder.decode(data.decode("utf-8"))
         except Exception:
             return None
 
+    def _get(self, path, timeout=5):
+        return self._decode(self._request("GET", path, timeout=timeout))
+
     def _post(self, path, body=None, query="", timeout=10):
-        url = f"{self.base_url}{path}{query}"
-        data = json.dumps(body or {}).encode()
-        req = urllib.request.Request(
-            url, data=data, headers={"Content-Type": "application/json"}, method="POST"
+        payload = json.dumps(body).encode() if body else self._EMPTY_BODY
+        return self._decode(
+            self._request("POST", f"{path}{query}", body=payload, timeout=timeout)
         )
-        try:
-            with urllib.request.urlopen(req, timeout=timeout) as resp:
-                return json.loads(resp.read().decode())
-        except Exception:
-            return None
 
     # ── API methods ──────────────────────────────────────────────────────
 
     def get_health(self):
-        """GET /api/health — returns full health payload including servers list."""
-        return self._get("/api/health")
+        """GET /api/health — returns ``(payload, sig)`` for the full health payload.
+
+        ``sig`` is a hash of the servers list that only changes when something
+        the GUI displays has changed; both are None if the request failed.
+        """
+        data = self._get("/api/health")
+        if not data:
+            return None, None
+        stable = [
+            {k: v for k, v in s.items() if k not in self._VOLATILE_SERVER_KEYS}
+            for s in data.get("servers", [])
+        ]
+        return data, hash(json.dumps(stable, sort_keys=True))
+
+    def stream_events(self, callback, stop_event, timeout=30):
+        """GET /api/events — block on the SSE stream until it closes or
+        ``stop_event`` is set, calling ``callback(event, data)`` per frame.
+
+        Uses its own connection so regular requests are not held up. Returns
+        False if the hub does not expose the endpoint; connection errors
+        propagate so the caller can retry.
+        """
+        conn = http.client.HTTPConnection(self.host, self.port, timeout=timeout)
+        try:
+            conn.request("GET", "/api/events", headers={"Accept": "text/event-stream"})
+            resp = conn.getresponse()
+            if resp.status != 200:
+                return False
+            event, data = "message", []
+            while not stop_event.is_set():
+                line = resp.readline()
+                if not line:
+                    break
+                line = line.decode("utf-8", errors="replace").rstrip("\r\n")
+                if not line:
+                    if data:
+                        try:
+                            payload = self._decoder.decode("\n".join(data))
+                        except ValueError:
+                            payload = None
+                        callback(event, payload)
+                    event, data = "message", []
+                elif line.startswith("event:"):
+                    event = line[6:].strip()
+                elif line.startswith("data:"):
+                    data.append(line[5:].lstrip())
+            return True
+        finally:
+            conn.close()
 
     def get_servers(self):
         """GET /api/servers — list all servers with status and capabilities."""
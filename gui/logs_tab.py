@@ -4,10 +4,25 @@ Logs tab — scrollable log viewer with level filtering and debug toggle.
 
 import os
 import threading
+import tkinter
+from collections import deque
 from datetime import datetime
 
 import customtkinter as ctk
 
+# Maximum number of log entries kept in memory and shown in the textbox.
+MAX_LOG_ENTRIES = 5000
+# Delay before pending log lines are flushed to the textbox in one batch.
+FLUSH_INTERVAL_MS = 50
+
+# Hub log file locations, in lookup order: XDG state path, then legacy fallback
+HOME = os.path.expanduser("~")
+_XDG_STATE = os.environ.get("XDG_STATE_HOME", os.path.join(HOME, ".local", "state"))
+LOG_PATHS = [
+    os.path.join(_XDG_STATE, "mcp-hub", "logs", "mcp-hub.log"),
+    os.path.join(HOME, ".mcp-hub", "logs", "mcp-hub.log"),
+]
+
 
 class LogsTab(ctk.CTkFrame):
     """Tab that shows hub logs with debug filtering options."""
@@ -20,14 +35,25 @@ class LogsTab(ctk.CTkFrame):
         "HUB": "#9b59b6",
     }
 
+    # Pre-bound formatter for a single "[ts] [level] message" line
+    _LINE_FMT = "[{}] [{}] {}\n".format
+
     def __init__(self, master, client, project_root, **kwargs):
         super().__init__(master, fg_color="transparent", **kwargs)
         self.client = client
         self.project_root = project_root
         self.show_debug = False
-        self.log_entries = []  # list of (level, text)
+        self.log_entries = deque(maxlen=MAX_LOG_ENTRIES)  # (ts, level, text)
+        # The same entries indexed by level, so a single-level view skips the
+        # scan; kept in step with log_entries, so it holds nothing extra
+        self._by_level = {lvl: deque() for lvl in self.LOG_COLORS}
+        self._line_count = 0  # lines currently in the textbox
+        self._pending = []  # (ts, level, text) waiting for the next flush
+        self._flush_scheduled = False
+        self._stale = False  # entries were skipped while the tab was hidden
 
         self._build_ui()
+        self.winfo_toplevel().bind("<Map>", self._on_map, add="+")
 
     def _build_ui(self):
         # ── Toolbar ──────────────────────────────────────────────────────
@@ -85,29 +111,90 @@ class LogsTab(ctk.CTkFrame):
         open_log_btn.pack(side="right", padx=4)
 
         # ── Log text area ────────────────────────────────────────────────
-        self.log_text = ctk.CTkTextbox(
-            self,
-            font=ctk.CTkFont(family="Consolas", size=12),
-            state="disabled",
+        # A plain tkinter.Text is used instead of CTkTextbox, whose per-insert
+        # overhead grows until the UI freezes under streaming logs.
+        theme = ctk.ThemeManager.theme["CTkTextbox"]
+        textbox_frame = ctk.CTkFrame(self, fg_color=theme["fg_color"])
+        textbox_frame.pack(fill="both", expand=True, padx=4, pady=(0, 4))
+
+        self.log_text = tkinter.Text(
+            textbox_frame,
+            bg=self._theme_color(theme["fg_color"]),
+            fg=self._theme_color(theme["text_color"]),
+            insertbackground=self._theme_color(theme["text_color"]),
+            font=("Consolas", 12),
             wrap="word",
+            state="disabled",
+            bd=0,
+            highlightthickness=0,
         )
-        self.log_text.pack(fill="both", expand=True, padx=4, pady=(0, 4))
+        scrollbar = ctk.CTkScrollbar(textbox_frame, command=self.log_text.yview)
+        self.log_text.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side="right", fill="y", padx=(0, 2), pady=2)
+        self.log_text.pack(side="left", fill="both", expand=True, padx=(6, 0), pady=6)
+
+        # One tag per level so coloring is applied by Tk at insert time
+        for lvl, color in self.LOG_COLORS.items():
+            self.log_text.tag_config(lvl, foreground=color)
+
+    @staticmethod
+    def _theme_color(color):
+        """Resolve a CustomTkinter (light, dark) color pair for plain Tk widgets."""
+        if isinstance(color, (list, tuple)):
+            return color[1] if ctk.get_appearance_mode() == "Dark" else color[0]
+        return color
 
     # ── Public API ───────────────────────────────────────────────────────
 
     def append_log(self, level, message):
         """Add a log entry. Called from the main thread."""
         ts = datetime.now().strftime("%H:%M:%S")
-        self.log_entries.append((level, message))
+        entry = (ts, level, message)
+        if len(self.log_entries) == MAX_LOG_ENTRIES:
+            # The oldest entry is about to be evicted; drop it from the index too
+            old_level = self.log_entries[0][1]
+            by_level = self._by_level[old_level]
+            by_level.popleft()
+            if not by_level and old_level not in self.LOG_COLORS:
+                del self._by_level[old_level]
+        self.log_entries.append(entry)
+        self._by_level.setdefault(level, deque()).append(entry)
 
         # Apply current filter
         if not self._passes_filter(level):
             return
 
-        self._write_line(ts, level, message)
+        # Skip all widget work while hidden; on_show() replays the buffer
+        if not self.log_text.winfo_viewable():
+            self._stale = True
+            return
+
+        self._pending.append(entry)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after(FLUSH_INTERVAL_MS, self._flush)
+
+    def on_show(self):
+        """Repopulate the textbox if entries arrived while the tab was hidden.
+
+        Called when the Logs tab is selected, before Tk has mapped it. Lines
+        can still be skipped as hidden until then, so the replay waits for
+        the idle handlers that map the tab.
+        """
+        self.after_idle(self._replay_if_viewable)
 
     # ── Internals ────────────────────────────────────────────────────────
 
+    def _on_map(self, event):
+        # Restoring a minimized window does not switch tabs, so catch it here
+        # once Tk has mapped its children at idle time
+        if event.widget is self.winfo_toplevel():
+            self.after_idle(self._replay_if_viewable)
+
+    def _replay_if_viewable(self):
+        if self._stale and self.log_text.winfo_viewable():
+            self._redraw()
+
     def _passes_filter(self, level):
         if level == "DEBUG" and not self.show_debug:
             return False
@@ -116,23 +203,61 @@ class LogsTab(ctk.CTkFrame):
             return False
         return True
 
-    def _write_line(self, ts, level, message):
-        color = self.LOG_COLORS.get(level, "white")
-        line = f"[{ts}] [{level}] {message}\n"
+    def _flush(self):
+        """Write all pending lines to the textbox with a single insert."""
+        self._flush_scheduled = False
+        if self._stale and self.log_text.winfo_viewable():
+            # Lines were skipped as hidden since the last replay; the pending
+            # ones are in log_entries too, so a redraw covers both
+            self._redraw()
+            return
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        self._insert_lines(pending)
+
+    def _insert_lines(self, entries):
+        """Append (ts, level, text) entries with one tagged insert call."""
+        fmt = self._LINE_FMT
+        args = [
+            part
+            for ts, level, message in entries
+            for part in (fmt(ts, level, message), level)
+        ]
+
         self.log_text.configure(state="normal")
-        self.log_text.insert("end", line)
+        if args:
+            self.log_text.insert("end", *args)
+        self._line_count += len(entries)
+        self._trim()
         self.log_text.configure(state="disabled")
         self.log_text.see("end")
 
+    def _trim(self):
+        """Drop the oldest textbox lines beyond MAX_LOG_ENTRIES."""
+        excess = self._line_count - MAX_LOG_ENTRIES
+        if excess > 0:
+            self.log_text.delete("1.0", f"{excess + 1}.0")
+            self._line_count -= excess
+
     def _redraw(self):
         """Rewrite all visible log entries applying current filters."""
+        self._pending.clear()
+        self._stale = False
+        selected = self.level_filter.get()
+        if selected == "ALL":
+            if self.show_debug:
+                visible = list(self.log_entries)
+            else:
+                visible = [entry for entry in self.log_entries if entry[1] != "DEBUG"]
+        elif selected == "DEBUG" and not self.show_debug:
+            visible = []
+        else:
+            visible = list(self._by_level.get(selected, ()))
         self.log_text.configure(state="normal")
         self.log_text.delete("1.0", "end")
-        self.log_text.configure(state="disabled")
-        for level, msg in self.log_entries:
-            if self._passes_filter(level):
-                ts = datetime.now().strftime("%H:%M:%S")
-                self._write_line(ts, level, msg)
+        self._line_count = 0
+        self._insert_lines(visible)
 
     def _on_debug_toggle(self):
         self.show_debug = self.debug_var.get()
@@ -143,21 +268,22 @@ class LogsTab(ctk.CTkFrame):
 
     def _clear_logs(self):
         self.log_entries.clear()
+        for by_level in self._by_level.values():
+            by_level.clear()
+        self._pending.clear()
+        self._stale = False
         self.log_text.configure(state="normal")
         self.log_text.delete("1.0", "end")
         self.log_text.configure(state="disabled")
+        self._line_count = 0
 
     def _open_log_file(self):
         """Try to open the MCP Hub log file."""
         import platform as plat
         import subprocess
 
-        # XDG state path or fallback
-        xdg = os.environ.get("XDG_STATE_HOME", os.path.join(os.path.expanduser("~"), ".local", "state"))
-        log_path = os.path.join(xdg, "mcp-hub", "logs", "mcp-hub.log")
-        if not os.path.isfile(log_path):
-            log_path = os.path.join(os.path.expanduser("~"), ".mcp-hub", "logs", "mcp-hub.log")
-        if not os.path.isfile(log_path):
+        log_path = next((p for p in LOG_PATHS if os.path.isfile(p)), None)
+        if log_path is None:
             self.append_log("WARN", f"Log file not found at expected paths")
             return
         try:
@@ -3,9 +3,19 @@ Servers tab — displays each connected MCP server as a card with a collapsible
 list of its exposed tools and an enable / disable toggle.
 """
 
-import threading
 import customtkinter as ctk
 
+from hub_client import run_async
+
+# Badge colors keyed by the status shown on a server card
+STATUS_COLORS = {
+    "connected": "#2ecc71",
+    "connecting": "orange",
+    "disconnected": "gray",
+    "disabled": "#e74c3c",
+    "error": "#e74c3c",
+}
+
 
 class ToolsList(ctk.CTkFrame):
     """Collapsible list of tools for a single MCP server card."""
@@ -14,6 +24,8 @@ class ToolsList(ctk.CTkFrame):
         super().__init__(master, **kwargs)
         self.tools = tools or []
         self.expanded = False
+        self._rendered_sig = ()  # (name, short description) rows for self.tools
+        self._built = False  # whether list_frame holds the rows yet
 
         self.toggle_btn = ctk.CTkButton(
             self,
@@ -31,28 +43,45 @@ class ToolsList(ctk.CTkFrame):
 
         self.list_frame = ctk.CTkFrame(self, fg_color="transparent")
         # hidden by default
+        self.set_tools(self.tools)
 
     def _toggle(self):
         if self.expanded:
             self.list_frame.pack_forget()
             self.toggle_btn.configure(text=f"Tools ({len(self.tools)})  ▸")
         else:
+            if not self._built:
+                self._build_rows()
             self.list_frame.pack(fill="x", padx=12, pady=(0, 4))
             self.toggle_btn.configure(text=f"Tools ({len(self.tools)})  ▾")
         self.expanded = not self.expanded
 
     def set_tools(self, tools):
+        """Store the tools; rows are only built once the list is expanded."""
         self.tools = tools or []
         self.toggle_btn.configure(
             text=f"Tools ({len(self.tools)})  {'▾' if self.expanded else '▸'}"
         )
-        # Clear previous entries
-        for w in self.list_frame.winfo_children():
-            w.destroy()
+        rows = []
         for tool in self.tools:
-            name = tool.get("name", "unknown")
             desc = tool.get("description", "")
             short = (desc[:80] + "...") if len(desc) > 80 else desc
+            rows.append((tool.get("name", "unknown"), short))
+        sig = tuple(rows)
+        if sig == self._rendered_sig:
+            return
+        self._rendered_sig = sig
+
+        # Clear previous entries
+        if self._built:
+            for w in self.list_frame.winfo_children():
+                w.destroy()
+            self._built = False
+        if self.expanded:
+            self._build_rows()
+
+    def _build_rows(self):
+        for name, short in self._rendered_sig:
             lbl = ctk.CTkLabel(
                 self.list_frame,
                 text=f"  •  {name}",
@@ -69,6 +98,7 @@ class ToolsList(ctk.CTkFrame):
                     anchor="w",
                 )
                 dlbl.pack(fill="x", anchor="w")
+        self._built = True
 
 
 class ServerCard(ctk.CTkFrame):
@@ -83,12 +113,21 @@ class ServerCard(ctk.CTkFrame):
 
         self._build(server_data)
 
-    def _build(self, data):
-        status = data.get("status", "unknown")
+    @staticmethod
+    def _summary(data):
+        """Return the (display_status, disabled, meta_text) shown in the card header."""
         disabled = data.get("disabled", False)
-        tools = data.get("tools", [])
+        display_status = "disabled" if disabled else data.get("status", "unknown")
+        transport = data.get("type") or ("remote" if data.get("url") else "stdio")
         resources = data.get("resources", [])
         prompts = data.get("prompts", [])
+        meta_text = f"Transport: {transport}    Resources: {len(resources)}    Prompts: {len(prompts)}"
+        return display_status, disabled, meta_text
+
+    def _build(self, data):
+        display_status, disabled, meta_text = self._summary(data)
+        tools = data.get("tools", [])
+        self._sig = (display_status, disabled, meta_text)
 
         # ── Header row ───────────────────────────────────────────────────
         header = ctk.CTkFrame(self, fg_color="transparent")
@@ -103,31 +142,22 @@ class ServerCard(ctk.CTkFrame):
         name_lbl.pack(side="left")
 
         # Status badge
-        color_map = {
-            "connected": "#2ecc71",
-            "connecting": "orange",
-            "disconnected": "gray",
-            "disabled": "#e74c3c",
-            "error": "#e74c3c",
-        }
-        display_status = "disabled" if disabled else status
-        badge_color = color_map.get(display_status, "gray")
-        badge = ctk.CTkLabel(
+        self._badge = ctk.CTkLabel(
             header,
             text=f" {display_status.upper()} ",
             font=ctk.CTkFont(size=10),
-            fg_color=badge_color,
+            fg_color=STATUS_COLORS.get(display_status, "gray"),
             corner_radius=4,
             text_color="white",
         )
-        badge.pack(side="left", padx=(8, 0))
+        self._badge.pack(side="left", padx=(8, 0))
 
         # Enable / Disable switch
-        self.enabled_var = ctk.BooleanVar(value=not disabled)
+        self._enabled_var = ctk.BooleanVar(value=not disabled)
         switch = ctk.CTkSwitch(
             header,
             text="Enabled",
-            variable=self.enabled_var,
+            variable=self._enabled_var,
             width=40,
             command=self._on_switch,
             onvalue=True,
@@ -139,45 +169,61 @@ class ServerCard(ctk.CTkFrame):
         info = ctk.CTkFrame(self, fg_color="transparent")
         info.pack(fill="x", padx=14, pady=(0, 2))
 
-        transport = data.get("type") or ("remote" if data.get("url") else "stdio")
-        meta_text = f"Transport: {transport}    Resources: {len(resources)}    Prompts: {len(prompts)}"
-        meta_lbl = ctk.CTkLabel(
+        self._meta_lbl = ctk.CTkLabel(
             info, text=meta_text, font=ctk.CTkFont(size=11), text_color="gray", anchor="w"
         )
-        meta_lbl.pack(anchor="w")
+        self._meta_lbl.pack(anchor="w")
 
         # ── Collapsible tools list ───────────────────────────────────────
         self.tools_list = ToolsList(self, tools=tools, fg_color="transparent")
         self.tools_list.pack(fill="x", padx=6, pady=(0, 6))
 
     def _on_switch(self):
-        enabled = self.enabled_var.get()
-
-        def do():
-            if enabled:
-                self.client.start_server(self.server_name)
-            else:
-                self.client.stop_server(self.server_name, disable=True)
+        def done(_result):
             if self.on_toggle:
-                self.after(0, self.on_toggle)
+                self.on_toggle()
 
-        threading.Thread(target=do, daemon=True).start()
+        if self._enabled_var.get():
+            run_async(self, self.client.start_server, self.server_name, callback=done)
+        else:
+            run_async(
+                self, self.client.stop_server, self.server_name, disable=True, callback=done
+            )
 
     def update_data(self, data):
-        """Rebuild the card content with fresh data."""
+        """Update the card in place, touching only widgets whose data changed."""
+        old_tools = self.server_data.get("tools", [])
         self.server_data = data
-        for w in self.winfo_children():
-            w.destroy()
-        self._build(data)
+
+        sig = self._summary(data)
+        display_status, disabled, meta_text = sig
+        # Compare with the switch itself, so a failed toggle gets reverted
+        if self._enabled_var.get() == disabled:
+            self._enabled_var.set(not disabled)
+        if sig != self._sig:
+            if display_status != self._sig[0]:
+                self._badge.configure(
+                    text=f" {display_status.upper()} ",
+                    fg_color=STATUS_COLORS.get(display_status, "gray"),
+                )
+            if meta_text != self._sig[2]:
+                self._meta_lbl.configure(text=meta_text)
+            self._sig = sig
+
+        tools = data.get("tools", [])
+        if tools != old_tools:
+            self.tools_list.set_tools(tools)
 
 
 class ServersTab(ctk.CTkFrame):
     """Tab that shows all connected MCP servers as cards."""
 
-    def __init__(self, master, client, **kwargs):
+    def __init__(self, master, client, on_toggle=None, **kwargs):
         super().__init__(master, fg_color="transparent", **kwargs)
         self.client = client
+        self.on_toggle = on_toggle
         self.cards: dict[str, ServerCard] = {}
+        self._last_sig = None
 
         # Scrollable container
         self.scroll = ctk.CTkScrollableFrame(self, fg_color="transparent")
@@ -192,8 +238,22 @@ class ServersTab(ctk.CTkFrame):
         )
         self.empty_label.pack(pady=40)
 
-    def refresh(self, servers_list):
-        """Redraw cards from a fresh list of server data dicts."""
+    def _on_card_toggle(self):
+        # The toggle may have failed with no change in server data, so force
+        # the next refresh through to resync the card's switch
+        self._last_sig = None
+        if self.on_toggle:
+            self.on_toggle()
+
+    def refresh(self, servers_list, sig=None):
+        """Redraw cards from a fresh list of server data dicts.
+
+        ``sig`` identifies the payload; a repeat of the last one is skipped.
+        """
+        if sig is not None and sig == self._last_sig:
+            return
+        self._last_sig = sig
+
         current_names = {s.get("name") for s in servers_list}
         existing_names = set(self.cards.keys())
 
@@ -219,7 +279,7 @@ class ServersTab(ctk.CTkFrame):
                     self.scroll,
                     sdata,
                     self.client,
-                    on_toggle=lambda: None,
+                    on_toggle=self._on_card_toggle,
                 )
                 card.pack(fill="x", padx=4, pady=4)
                 self.cards[name] = card
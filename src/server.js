@@ -288,6 +288,10 @@ class ServiceManager {
 
     process.on("SIGTERM", shutdown("SIGTERM"));
     process.on("SIGINT", shutdown("SIGINT"));
+    // Sent by the GUI on Windows, where SIGTERM cannot be delivered
+    if (process.platform === "win32") {
+      process.on("SIGBREAK", shutdown("SIGBREAK"));
+    }
   }
 
   async shutdown() {